@@ -6,9 +6,14 @@ Data quality validation tool
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import re
+import csv
+import io
 from datetime import datetime
+from html import escape
 import base64
+import hashlib
 
 # Page config - MUST BE FIRST!
 st.set_page_config(
@@ -232,6 +237,20 @@ def check_transaction_ids(df):
     return True, "Transaction ID Field Validation", [f"✅ All {len(df):,} transaction IDs are whole numbers"]
 
 
+# Item colon placement rules, shared by check_items_combined and fix_item
+ITEM_ID_PATTERN = r'^([A-Z0-9.-]+)(?=\s|\()'
+ITEM_COLON_AFTER_DASH_PATTERN = r'^[A-Z0-9.-]+ - [^:]+:'
+ITEM_IMPROVEMENT_PATTERN = r'^[A-Z0-9.-]+:\s*-\s+'
+
+
+def missing_colon_before_paren(item):
+    """True if the item has a '(' with no ':' before it"""
+    if '(' not in item:
+        return False
+    first_colon_pos = item.find(':')
+    return first_colon_pos == -1 or first_colon_pos > item.find('(')
+
+
 def check_items_combined(df):
     """Combined item field validation"""
     if '_Item' not in df.columns:
@@ -257,29 +276,21 @@ def check_items_combined(df):
     results.append(f"✅ {special_char_count:,} items contain special characters")
     
     # Colon placement check
-    missing_colon_pattern = r'^[^:(]+\('
-    colon_after_dash_pattern = r'^[A-Z0-9.-]+ - [^:]+:'
-    improvement_pattern = r'^[A-Z0-9.-]+:\s*-\s+'
-    
     missing_colon_count = 0
     colon_after_dash_count = 0
     
     for idx, row in items_with_data.iterrows():
         item = str(row['_Item'])
         
-        if '(' in item:
-            first_colon_pos = item.find(':')
-            first_paren_pos = item.find('(')
-            
-            if first_colon_pos == -1 or first_colon_pos > first_paren_pos:
-                missing_colon_count += 1
-                errors.append({
-                    'item': item,
-                    'issue': 'Missing colon before parenthesis'
-                })
-                continue
+        if missing_colon_before_paren(item):
+            missing_colon_count += 1
+            errors.append({
+                'item': item,
+                'issue': 'Missing colon before parenthesis'
+            })
+            continue
         
-        if re.match(colon_after_dash_pattern, item):
+        if re.match(ITEM_COLON_AFTER_DASH_PATTERN, item):
             colon_after_dash_count += 1
             errors.append({
                 'item': item,
@@ -287,14 +298,10 @@ def check_items_combined(df):
             })
             continue
         
-        if re.match(improvement_pattern, item):
-            item_id = item.split(':')[0]
-            rest_of_item = ':'.join(item.split(':')[1:])  # Get everything after first colon
-            # Remove the "- " pattern after colon and reconstruct
-            rest_cleaned = rest_of_item.strip().lstrip('-').strip()
+        if re.match(ITEM_IMPROVEMENT_PATTERN, item):
             improvements.append({
                 'item': item,
-                'suggestion': f"Consider: {item_id}:{item_id} - {rest_cleaned}"
+                'suggestion': f"Consider: {improve_item_format(item)}"
             })
     
     # Add colon placement results
@@ -314,6 +321,15 @@ def check_items_combined(df):
     return all_passed, "Item Field Validation", results, errors, improvements
 
 
+def improve_item_format(item):
+    """Rewrite 'ID: - rest' as 'ID:ID - rest'"""
+    item_id = item.split(':')[0]
+    rest_of_item = ':'.join(item.split(':')[1:])  # Get everything after first colon
+    # Remove the "- " pattern after colon and reconstruct
+    rest_cleaned = rest_of_item.strip().lstrip('-').strip()
+    return f"{item_id}:{item_id} - {rest_cleaned}"
+
+
 def check_accounts(df):
     """Check accounts"""
     if '_Account' not in df.columns:
@@ -357,9 +373,427 @@ def check_amounts(df):
     return True, "Amount-related Fields Validation", ["✅ All amount columns are numeric"]
 
 
-def generate_html_report(filename, checks, all_passed, total_rows, total_cols, colon_errors=None, colon_improvements=None):
+# ============================================================================
+# COLUMN PROFILING (fixed-size sketches over the loaded DataFrame)
+# ============================================================================
+
+PROFILE_CHUNK_SIZE = 50000
+PROFILE_AMOUNT_COLS = ['_Debit', '_Credit', '_Amount']
+PROFILE_DATE_COLS = ['_Date', '_Ship Date']
+AMOUNT_PATTERN = r'^-?(\d+\.?\d*|\.\d+)$'
+GROUPED_AMOUNT_PATTERN = r'^\(?-?\d{1,3}(,\d{3})+(\.\d*)?\)?$'
+DATE_FORMATS = ['%m/%d/%Y', '%m/%d/%y', '%Y-%m-%d', '%m-%d-%Y', '%Y/%m/%d', '%d-%b-%Y', '%d-%b-%y']
+TIME_SUFFIXES = ['', ' %H:%M', ' %H:%M:%S', ' %I:%M %p', ' %I:%M:%S %p', 'T%H:%M:%S']
+
+
+def normalize_amount(value):
+    """Strip currency symbols and thousands separators; '(12.50)' becomes '-12.50'"""
+    cleaned = value.strip().replace('$', '').replace(' ', '')
+    if ',' in cleaned:
+        # Only commas in thousands groups; '1.234,50' or '12,50' must not silently change value
+        if not re.match(GROUPED_AMOUNT_PATTERN, cleaned):
+            return None
+        cleaned = cleaned.replace(',', '')
+    if cleaned.startswith('(') and cleaned.endswith(')'):
+        cleaned = '-' + cleaned[1:-1]
+    
+    return cleaned if re.match(AMOUNT_PATTERN, cleaned) else None
+
+
+def parse_dates(values):
+    """Parse a Series against DATE_FORMATS (optionally with a time); anything else becomes NaT"""
+    # Date columns repeat heavily, so parse each distinct value once
+    codes, uniques = pd.factorize(values.astype(str).str.strip())
+    text = pd.Series(uniques)
+    parsed = pd.Series(pd.NaT, index=text.index, dtype='datetime64[ns]')
+    
+    # Each format only sees the values no earlier format matched
+    for fmt in DATE_FORMATS:
+        for suffix in TIME_SUFFIXES:
+            pending = parsed.isna()
+            if not pending.any():
+                break
+            parsed[pending] = pd.to_datetime(text[pending], format=fmt + suffix, errors='coerce')
+    
+    return pd.Series(parsed.to_numpy()[codes], index=values.index)
+
+
+class HyperLogLog:
+    """Approximate distinct count in 2^p one-byte registers (~1% error at p=14)"""
+    
+    def __init__(self, p=14):
+        self.p = p
+        self.m = 1 << p
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+    
+    def update(self, hashes):
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        if len(hashes) == 0:
+            return
+        
+        # Top p bits pick the register, the remaining bits give the rank
+        q = 64 - self.p
+        idx = (hashes >> np.uint64(q)).astype(np.int64)
+        rest = hashes & np.uint64((1 << q) - 1)
+        # rest fits in 50 bits, so the float conversion is exact and frexp's exponent is its bit length
+        _, bit_length = np.frexp(rest.astype(np.float64))
+        rank = (q + 1 - bit_length).astype(np.uint8)
+        np.maximum.at(self.registers, idx, rank)
+    
+    def count(self):
+        m = self.m
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.exp2(-self.registers.astype(np.float64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros > 0:
+            estimate = m * np.log(m / zeros)  # Linear counting for small cardinalities
+        return int(round(estimate))
+
+
+class HeavyHitters:
+    """Misra-Gries summary: keeps at most k counters, counts are lower bounds"""
+    
+    def __init__(self, k=256):
+        self.k = k
+        self.counters = pd.Series(dtype='int64')  # Keyed by value hash
+        self.labels = {}  # Hash -> original value, for surviving counters only
+        self.error = 0  # Upper bound on how far any count may be undercounted
+    
+    def update(self, values, hashes):
+        # Count hashes rather than the values themselves: integer counting is much faster than text
+        counts = pd.Series(hashes).value_counts(sort=False)
+        self.counters = pd.concat([self.counters, counts]).groupby(level=0, sort=False).sum()
+        
+        if len(self.counters) > self.k:
+            cut = int(self.counters.nlargest(self.k + 1).iloc[-1])
+            self.error += cut
+            self.counters = self.counters[self.counters > cut] - cut
+        
+        missing = [h for h in self.counters.index if h not in self.labels]
+        if missing:
+            first = pd.Series(values.to_numpy(), index=hashes)
+            first = first[~first.index.duplicated()]
+            self.labels.update(first.reindex(missing).items())
+        self.labels = {h: self.labels[h] for h in self.counters.index}
+    
+    def top(self, n=5):
+        """Most frequent values; only counters above the error bound are guaranteed heavy hitters"""
+        heavy = self.counters[self.counters > self.error]
+        return [(self.labels[h], int(c)) for h, c in heavy.nlargest(n).items()]
+
+
+class QuantileSketch:
+    """KLL-style compactor stack: each level holds at most k values of weight 2^level"""
+    
+    def __init__(self, k=256, seed=0):
+        self.k = k
+        self.levels = [np.empty(0)]
+        self.rng = np.random.default_rng(seed)
+        self.count = 0
+        self.min = None
+        self.max = None
+    
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        if len(values) == 0:
+            return
+        
+        self._track(len(values), values.min(), values.max())
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+    
+    def _track(self, count, low, high):
+        self.count += count
+        self.min = float(low) if self.min is None else min(self.min, float(low))
+        self.max = float(high) if self.max is None else max(self.max, float(high))
+    
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            values = self.levels[level]
+            if len(values) > self.k:
+                values = np.sort(values)
+                # Odd leftover stays at this level; every other value moves up with double weight
+                keep = values[:len(values) % 2]
+                promoted = values[len(values) % 2:][self.rng.integers(2)::2]
+                self.levels[level] = keep
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+    
+    def quantile(self, q):
+        if self.count == 0:
+            return None
+        
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(v), 2.0 ** level) for level, v in enumerate(self.levels)])
+        order = np.argsort(values, kind='stable')
+        cumulative = np.cumsum(weights[order])
+        pos = int(np.searchsorted(cumulative, q * cumulative[-1]))
+        return float(values[order][min(pos, len(values) - 1)])
+
+
+class ColumnProfile:
+    """Null rate, distinct count, top values, and amount/date ranges for one column"""
+    
+    def __init__(self, name):
+        self.name = name
+        self.rows = 0
+        self.nulls = 0
+        self.distinct = HyperLogLog()
+        self.top = HeavyHitters()
+        self.amounts = QuantileSketch() if name in PROFILE_AMOUNT_COLS else None
+        self.unparsed = 0
+        self.is_date = name in PROFILE_DATE_COLS
+        self.date_min = None
+        self.date_max = None
+    
+    def update(self, series):
+        self.rows += len(series)
+        present = series.dropna()
+        self.nulls += len(series) - len(present)
+        if len(present) == 0:
+            return
+        
+        hashes = pd.util.hash_pandas_object(present, index=False).to_numpy()
+        self.distinct.update(hashes)
+        self.top.update(present, hashes)
+        
+        if self.amounts is not None:
+            amounts = present
+            if not pd.api.types.is_numeric_dtype(amounts):
+                # Parse "1,234.50", "(12.50)" and "$5" the same way auto-fix normalizes them
+                amounts = amounts.astype(str).map(normalize_amount)
+            numbers = pd.to_numeric(amounts, errors='coerce')
+            self.unparsed += int(numbers.isna().sum())
+            self.amounts.update(numbers.dropna().to_numpy())
+        
+        if self.is_date:
+            dates = parse_dates(present)
+            self.unparsed += int(dates.isna().sum())
+            dates = dates.dropna()
+            if len(dates) > 0:
+                self._track_dates(dates.min(), dates.max())
+    
+    def _track_dates(self, low, high):
+        self.date_min = low if self.date_min is None else min(self.date_min, low)
+        self.date_max = high if self.date_max is None else max(self.date_max, high)
+    
+    def summary(self):
+        """Flatten the sketches into display strings for the UI and report"""
+        null_rate = self.nulls / self.rows if self.rows else 0.0
+        bound = "≥" if self.top.error else ""
+        top_values = ", ".join(
+            f"{str(value)[:40]} ({bound}{n:,})" for value, n in self.top.top(3)
+        )
+        if not top_values and self.rows > self.nulls:
+            top_values = "No dominant values"
+        
+        low = high = median = p95 = ""
+        if self.amounts is not None and self.amounts.count > 0:
+            low = f"{self.amounts.min:,.2f}"
+            high = f"{self.amounts.max:,.2f}"
+            median = f"{self.amounts.quantile(0.5):,.2f}"
+            p95 = f"{self.amounts.quantile(0.95):,.2f}"
+        elif self.date_min is not None:
+            low = self.date_min.strftime("%Y-%m-%d")
+            high = self.date_max.strftime("%Y-%m-%d")
+        
+        return {
+            'column': self.name,
+            'null_rate': f"{null_rate:.1%}",
+            'distinct': f"≈{self.distinct.count():,}" if self.rows > self.nulls else "0",
+            'top_values': top_values,
+            'unparsed': f"{self.unparsed:,}" if self.amounts is not None or self.is_date else "",
+            'min': low,
+            'max': high,
+            'median': median,
+            'p95': p95,
+        }
+
+
+def profile_columns(df, chunk_size=PROFILE_CHUNK_SIZE):
+    """Profile every column of the loaded DataFrame.
+    
+    Rows are fed in chunks to bound the temporary arrays built per update;
+    the sketch state itself is fixed-size, but df is already fully in memory.
+    """
+    profiles = {col: ColumnProfile(col) for col in df.columns}
+    
+    for start in range(0, len(df), chunk_size):
+        chunk = df.iloc[start:start + chunk_size]
+        for col in df.columns:
+            profiles[col].update(chunk[col])
+    
+    return [profiles[col].summary() for col in df.columns]
+
+
+# ============================================================================
+# AUTO-FIX (streams the raw CSV, untouched rows are copied byte for byte)
+# ============================================================================
+
+AUTOFIX_ITEM_FIXES = ['missing_colon', 'colon_after_dash', 'format_improvement']
+AUTOFIX_AMOUNT_COLS = ['_Debit', '_Credit', '_Amount']
+AUTOFIX_DATE_COLS = ['_Date', '_Ship Date']
+AUTOFIX_LOG_HEADER = ['row', 'column', 'original', 'fixed', 'reason']
+DATETIME_TIME_PATTERN = r'^\S+?((?:T|\s+)\d.*)$'
+
+
+def fix_item(item, fixes=AUTOFIX_ITEM_FIXES):
+    """Apply the check_items_combined rules to one item.
+    
+    Returns (fixed_item, reason); fixed_item is None when nothing applies or
+    the item has an error that cannot be fixed automatically.
+    """
+    id_match = re.match(ITEM_ID_PATTERN, item)
+    
+    if missing_colon_before_paren(item):
+        # Prefix the leading ID so the first colon lands before the parenthesis
+        if 'missing_colon' in fixes and id_match:
+            return f"{id_match.group(1)}:{item}", 'Missing colon before parenthesis'
+        return None, 'Missing colon before parenthesis'
+    
+    if re.match(ITEM_COLON_AFTER_DASH_PATTERN, item):
+        if 'colon_after_dash' in fixes and id_match:
+            return f"{id_match.group(1)}:{item}", "Colon appears after dash (should be: ID:rest)"
+        return None, "Colon appears after dash (should be: ID:rest)"
+    
+    if re.match(ITEM_IMPROVEMENT_PATTERN, item) and 'format_improvement' in fixes:
+        return improve_item_format(item), 'Format improvement'
+    
+    return None, None
+
+
+def normalize_date(value, date_format='%m/%d/%Y'):
+    """Parse against the known export formats and re-emit as date_format.
+    
+    Datetimes are accepted too; a midnight time is dropped, any other time
+    is kept exactly as written and only the date part is rewritten.
+    """
+    text = value.strip()
+    for fmt in DATE_FORMATS:
+        for suffix in TIME_SUFFIXES:
+            try:
+                parsed = datetime.strptime(text, fmt + suffix)
+            except ValueError:
+                continue
+            if not suffix or parsed.time() == datetime.min.time():
+                return parsed.strftime(date_format)
+            # Date formats contain no spaces, so the time starts at the first space or 'T'
+            time_text = re.match(DATETIME_TIME_PATTERN, text).group(1)
+            if time_text.startswith('T'):
+                time_text = ' ' + time_text[1:]  # ISO separator does not fit the US date layout
+            return parsed.strftime(date_format) + time_text
+    return None
+
+
+def _fix_amount(value):
+    fixed = normalize_amount(value)
+    return fixed, 'Amount normalized' if fixed is not None else 'Non-numeric amount'
+
+
+def _fix_date(value, date_format):
+    fixed = normalize_date(value, date_format)
+    return fixed, 'Date normalized' if fixed is not None else 'Unrecognized date'
+
+
+def _raw_records(text_file):
+    """Yield (raw_text, fields) per CSV record, keeping the exact source text of each record"""
+    consumed = []
+    
+    def lines():
+        for line in text_file:
+            consumed.append(line)
+            yield line
+    
+    # csv.reader only pulls the lines it needs for the current record, so
+    # everything consumed since the last record is that record's raw text
+    for fields in csv.reader(lines()):
+        raw = ''.join(consumed)
+        consumed.clear()
+        yield raw, fields
+
+
+def _line_terminator(raw):
+    if raw.endswith('\r\n'):
+        return '\r\n'
+    if raw.endswith('\n') or raw.endswith('\r'):
+        return raw[-1]
+    return ''
+
+
+def autofix_csv(src, dst, log, fix_items=True, item_fixes=AUTOFIX_ITEM_FIXES,
+                normalize_amounts=False, normalize_dates=False, date_format='%m/%d/%Y'):
+    """Stream src to dst one record at a time, writing every change to log.
+    
+    src, dst and log are binary file objects. Records without changes are
+    copied verbatim; changed records are re-serialized with minimal quoting.
+    """
+    # surrogateescape lets any byte sequence round-trip unchanged
+    reader = io.TextIOWrapper(src, encoding='utf-8', errors='surrogateescape', newline='')
+    writer = io.TextIOWrapper(dst, encoding='utf-8', errors='surrogateescape', newline='')
+    log_writer = io.TextIOWrapper(log, encoding='utf-8', errors='surrogateescape', newline='')
+    change_log = csv.writer(log_writer)
+    change_log.writerow(AUTOFIX_LOG_HEADER)
+    
+    summary = {'rows': 0, 'rows_changed': 0, 'changes': 0, 'left_unfixed': 0}
+    
+    try:
+        records = _raw_records(reader)
+        header_raw, header = next(records, ('', []))
+        writer.write(header_raw)
+        
+        columns = {name.lstrip('\ufeff'): pos for pos, name in enumerate(header)}
+        targets = []  # (position, column name, fixer)
+        if fix_items and '_Item' in columns:
+            targets.append((columns['_Item'], '_Item', lambda v: fix_item(v, item_fixes)))
+        if normalize_amounts:
+            targets += [(columns[c], c, _fix_amount) for c in AUTOFIX_AMOUNT_COLS if c in columns]
+        if normalize_dates:
+            targets += [(columns[c], c, lambda v: _fix_date(v, date_format))
+                        for c in AUTOFIX_DATE_COLS if c in columns]
+        
+        for row_number, (raw, fields) in enumerate(records, start=1):
+            summary['rows'] += 1
+            changed = False
+            
+            for pos, col, fixer in targets:
+                if pos >= len(fields) or not fields[pos].strip():
+                    continue
+                
+                fixed, reason = fixer(fields[pos])
+                if fixed is None:
+                    if reason:
+                        summary['left_unfixed'] += 1
+                    continue
+                if fixed == fields[pos]:
+                    continue
+                
+                change_log.writerow([row_number, col, fields[pos], fixed, reason])
+                fields[pos] = fixed
+                summary['changes'] += 1
+                changed = True
+            
+            if changed:
+                summary['rows_changed'] += 1
+                csv.writer(writer, lineterminator=_line_terminator(raw)).writerow(fields)
+            else:
+                writer.write(raw)
+    finally:
+        # Hand the underlying file objects back to the caller instead of closing them
+        writer.flush()
+        log_writer.flush()
+        for wrapper in (reader, writer, log_writer):
+            wrapper.detach()
+    
+    return summary
+
+
+def generate_html_report(filename, checks, all_passed, total_rows, total_cols, colon_errors=None, colon_improvements=None, profile=None):
     """Generate HTML report"""
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    filename = escape(filename)
     
     # Check if there are improvements
     has_improvements = len(colon_improvements) > 0 if colon_improvements else False
@@ -484,7 +918,7 @@ def generate_html_report(filename, checks, all_passed, total_rows, total_cols, c
     
     for passed, title, messages in checks:
         status_class = "pass" if passed else "fail"
-        message_text = f"<strong>{title}:</strong><br>" + "<br>".join([f"  {m}" for m in messages])
+        message_text = f"<strong>{title}:</strong><br>" + "<br>".join([f"  {escape(m)}" for m in messages])
         html += f'<div class="check {status_class}">{message_text}</div>\n'
     
     if colon_errors and len(colon_errors) > 0:
@@ -495,7 +929,7 @@ def generate_html_report(filename, checks, all_passed, total_rows, total_cols, c
             <tr><th>Item</th><th>Issue</th></tr>
 """
         for error in colon_errors[:50]:  # Limit to 50
-            html += f"<tr><td>{error['item']}</td><td>{error['issue']}</td></tr>\n"
+            html += f"<tr><td>{escape(error['item'])}</td><td>{error['issue']}</td></tr>\n"
         html += "</table>\n"
     
     # Add optional improvements section
@@ -510,7 +944,22 @@ def generate_html_report(filename, checks, all_passed, total_rows, total_cols, c
             <tr><th>Item</th><th>Suggestion</th></tr>
 """
         for improvement in colon_improvements[:50]:  # Limit to 50
-            html += f"<tr><td>{improvement['item']}</td><td>{improvement['suggestion']}</td></tr>\n"
+            html += f"<tr><td>{escape(improvement['item'])}</td><td>{escape(improvement['suggestion'])}</td></tr>\n"
+        html += "</table>\n"
+    
+    # Add column profile section
+    if profile:
+        html += """
+        <h2>Column Profile</h2>
+        <p>Distinct counts are HyperLogLog estimates; top value counts and amount percentiles are approximate.</p>
+        <table>
+            <tr><th>Column</th><th>Null Rate</th><th>Distinct</th><th>Top Values</th><th>Unparsed</th><th>Min</th><th>Max</th><th>Median</th><th>P95</th></tr>
+"""
+        profile_cols = ['column', 'null_rate', 'distinct', 'top_values', 'unparsed', 'min', 'max', 'median', 'p95']
+        for row in profile:
+            # Top values carry free text from columns like _Memo and _Name
+            cells = "".join(f"<td>{escape(row[col])}</td>" for col in profile_cols)
+            html += f"<tr>{cells}</tr>\n"
         html += "</table>\n"
     
     html += """
@@ -578,6 +1027,9 @@ def main():
                     
                     all_passed = all(c[0] for c in checks)
                     
+                    # Profile columns in the same run
+                    profile = profile_columns(df)
+                    
                     # Check if there are warnings/improvements
                     has_improvements = len(colon_improvements) > 0 if colon_improvements else False
                     has_critical_errors = len(colon_errors) > 0 if colon_errors else False
@@ -611,7 +1063,7 @@ def main():
                     
                     for passed, title, messages in checks:
                         status_class = "pass" if passed else "fail"
-                        message_html = f"<strong>{title}:</strong><br>" + "<br>".join([f"  {m}" for m in messages])
+                        message_html = f"<strong>{title}:</strong><br>" + "<br>".join([f"  {escape(m)}" for m in messages])
                         st.markdown(f'<div class="check-result {status_class}">{message_html}</div>', unsafe_allow_html=True)
                     
                     # Show critical errors table
@@ -647,6 +1099,27 @@ def main():
                                 }
                             )
                     
+                    # Show column profile
+                    st.markdown("### Column Profile")
+                    with st.expander("View column profile", expanded=False):
+                        st.caption("Distinct counts are HyperLogLog estimates; top value counts and amount percentiles are approximate.")
+                        st.dataframe(
+                            pd.DataFrame(profile),
+                            use_container_width=True,
+                            hide_index=True,
+                            column_config={
+                                "column": st.column_config.TextColumn("Column", width="medium"),
+                                "null_rate": st.column_config.TextColumn("Null Rate", width="small"),
+                                "distinct": st.column_config.TextColumn("Distinct", width="small"),
+                                "top_values": st.column_config.TextColumn("Top Values", width="large"),
+                                "unparsed": st.column_config.TextColumn("Unparsed", width="small"),
+                                "min": st.column_config.TextColumn("Min", width="small"),
+                                "max": st.column_config.TextColumn("Max", width="small"),
+                                "median": st.column_config.TextColumn("Median", width="small"),
+                                "p95": st.column_config.TextColumn("P95", width="small")
+                            }
+                        )
+                    
                     # Generate HTML report
                     html_content = generate_html_report(
                         uploaded_file.name,
@@ -655,7 +1128,8 @@ def main():
                         len(df),
                         len(df.columns),
                         colon_errors,
-                        colon_improvements
+                        colon_improvements,
+                        profile
                     )
                     
                     # Download button
@@ -665,7 +1139,53 @@ def main():
                     b64 = base64.b64encode(html_content.encode()).decode()
                     href = f'<a href="data:text/html;base64,{b64}" download="{uploaded_file.name}_QA_Report.html" style="text-decoration:none;"><button style="background:#0051D5;color:white;border:none;border-radius:8px;padding:12px 24px;font-size:16px;cursor:pointer;">Download HTML Report</button></a>'
                     st.markdown(href, unsafe_allow_html=True)
-                    
+
+            # Auto-fix
+            st.markdown("---")
+            st.markdown("### Auto-Fix")
+            st.markdown("Write a corrected CSV and a change log. Rows without changes are copied exactly as uploaded.")
+
+            fix_items = st.checkbox("Fix _Item colon placement and formatting", value=True)
+            normalize_amounts = st.checkbox("Normalize amounts (remove $ and thousands separators)", value=False)
+            normalize_dates = st.checkbox("Normalize dates to MM/DD/YYYY", value=False)
+
+            # Results are only shown for the file content and options they were generated from,
+            # so a re-upload edited in place (same name and size) does not serve stale output
+            file_digest = hashlib.sha256(uploaded_file.getvalue()).hexdigest()
+            autofix_source = (file_digest, fix_items, normalize_amounts, normalize_dates)
+
+            if st.button("Generate Corrected CSV", use_container_width=True):
+                with st.spinner("Writing corrected CSV..."):
+                    uploaded_file.seek(0)
+                    fixed_file = io.BytesIO()
+                    log_file = io.BytesIO()
+                    summary = autofix_csv(
+                        uploaded_file,
+                        fixed_file,
+                        log_file,
+                        fix_items=fix_items,
+                        normalize_amounts=normalize_amounts,
+                        normalize_dates=normalize_dates
+                    )
+                    # Keep the results so both download buttons survive the rerun a download triggers
+                    st.session_state['autofix'] = {
+                        'source': autofix_source,
+                        'summary': summary,
+                        'fixed_data': fixed_file.getvalue(),
+                        'log_data': log_file.getvalue()
+                    }
+
+            autofix = st.session_state.get('autofix')
+            if autofix and autofix['source'] == autofix_source:
+                summary = autofix['summary']
+                st.success(f"{summary['changes']:,} changes in {summary['rows_changed']:,} of {summary['rows']:,} rows")
+                if summary['left_unfixed'] > 0:
+                    st.warning(f"{summary['left_unfixed']:,} values could not be fixed automatically - see the quality check for details")
+
+                base_name = uploaded_file.name.rsplit('.', 1)[0]
+                st.download_button("Download Corrected CSV", autofix['fixed_data'], file_name=f"{base_name}_Fixed.csv", mime="text/csv")
+                st.download_button("Download Change Log", autofix['log_data'], file_name=f"{base_name}_Changes.csv", mime="text/csv")
+
         except Exception as e:
             st.error(f"Error reading file: {str(e)}")
             st.info("Please make sure you uploaded a valid CSV file from QuickBooks")